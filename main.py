@@ -6,7 +6,7 @@ from typing import List, Dict, Any
 from datetime import datetime
 import os
 
-from utils import logger as logger_module, date_utils, json_exporter
+from utils import logger as logger_module, date_utils, json_exporter, transport
 from scrapers.g2_scraper import G2Scraper
 from scrapers.capterra_scraper import CapterraScraper
 from scrapers.trustradius_scraper import TrustRadiusScraper
@@ -91,6 +91,7 @@ def main():
     else:
         log.info("Single source, no merge needed")
 
+    transport.log_bandwidth_summary(log)
     log.info("Scraping completed")
 
 if __name__ == "__main__":
@@ -2,27 +2,12 @@ import time
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Any, Optional
-from utils import date_utils, logger
+from utils import date_utils, logger, transport
 
 class CapterraScraper:
     def __init__(self, logger: logger.logging.Logger):
         self.logger = logger
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-            "Referer": "https://www.google.com/"
-        })
+        self.session = transport.get_session()
         self.base_url = "https://www.capterra.com"
 
     def _get_product_url(self, company: str) -> Optional[str]:
@@ -0,0 +1,117 @@
+import gzip
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from urllib3.util.request import ACCEPT_ENCODING
+
+from utils import transport
+
+PAGE = b"<div class='review-card'>Great product</div>\n" * 1000
+GZIPPED_PAGE = gzip.compress(PAGE)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/length":
+            self._send_gzip_headers()
+            self.send_header("Content-Length", str(len(GZIPPED_PAGE)))
+            self.end_headers()
+            self.wfile.write(GZIPPED_PAGE)
+        elif self.path == "/chunked":
+            self._send_gzip_headers()
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(GZIPPED_PAGE), 64):
+                chunk = GZIPPED_PAGE[start:start + 64]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path.startswith("/redirect/"):
+            hops = int(self.path.rsplit("/", 1)[1])
+            target = f"/redirect/{hops - 1}" if hops > 1 else "/length"
+            self.send_response(302)
+            self.send_header("Location", target)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self.send_error(404)
+
+    def _send_gzip_headers(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Encoding", "gzip")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session():
+    session = transport._build_session()
+    yield session
+    session.close()
+
+
+def test_accept_encoding_only_lists_decodable_codings_in_preference_order():
+    supported = {token.strip() for token in ACCEPT_ENCODING.split(",")}
+    codings = [part.split(";")[0] for part in transport.build_accept_encoding().split(", ")]
+    assert codings
+    assert set(codings) <= supported
+    assert codings == [c for c in transport.ENCODING_PREFERENCE if c in codings]
+
+
+def test_content_length_response_counts_compressed_bytes(session, base_url):
+    response = session.get(f"{base_url}/length")
+    assert response.content == PAGE
+    stats = session.bandwidth_stats()["127.0.0.1"]
+    assert stats == {
+        "requests": 1,
+        "compressed_bytes": len(GZIPPED_PAGE),
+        "decompressed_bytes": len(PAGE),
+    }
+
+
+def test_chunked_response_counts_wire_bytes(session, base_url):
+    response = session.get(f"{base_url}/chunked")
+    assert response.content == PAGE
+    stats = session.bandwidth_stats()["127.0.0.1"]
+    assert stats["requests"] == 1
+    assert stats["decompressed_bytes"] == len(PAGE)
+    # Chunk framing is part of what crosses the wire
+    assert len(GZIPPED_PAGE) <= stats["compressed_bytes"] < len(PAGE)
+
+
+def test_redirect_chain_counts_each_hop_once(session, base_url):
+    response = session.get(f"{base_url}/redirect/2")
+    assert response.content == PAGE
+    assert len(response.history) == 2
+    stats = session.bandwidth_stats()["127.0.0.1"]
+    assert stats == {
+        "requests": 3,
+        "compressed_bytes": len(GZIPPED_PAGE),
+        "decompressed_bytes": len(PAGE),
+    }
+
+
+def test_bandwidth_summary_reports_unknown_when_unmeasured(monkeypatch, caplog):
+    session = transport.TransportSession()
+    session._stats["example.com"] = {
+        "requests": 1, "compressed_bytes": None, "decompressed_bytes": 100
+    }
+    monkeypatch.setattr(transport, "_session", session)
+    with caplog.at_level(logging.INFO):
+        transport.log_bandwidth_summary(logging.getLogger("test"))
+    assert "unknown bytes on wire" in caplog.text
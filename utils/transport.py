@@ -0,0 +1,190 @@
+"""
+Shared HTTP transport for all scrapers
+"""
+
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Connection pool sizing: one pool per review site, a few sockets each
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 4
+
+# Content codings ordered from most to least compact for HTML payloads
+ENCODING_PREFERENCE = ("br", "zstd", "gzip", "deflate")
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+    "Referer": "https://www.google.com/"
+}
+
+_session: Optional["TransportSession"] = None
+_session_lock = threading.Lock()
+
+
+def build_accept_encoding() -> str:
+    """
+    Build an Accept-Encoding value listing only codings urllib3 can decode
+
+    urllib3 advertises brotli and zstd only when their optional decoders
+    are installed, so this never offers a coding we cannot read back.
+    Preferred (more compact) codings get a higher q-value.
+
+    Returns:
+        Accept-Encoding header value, e.g. "gzip;q=1.0, deflate;q=0.9"
+    """
+    supported = {token.strip() for token in ACCEPT_ENCODING.split(",")}
+    available = [coding for coding in ENCODING_PREFERENCE if coding in supported]
+    return ", ".join(
+        f"{coding};q={1.0 - 0.1 * rank:.1f}" for rank, coding in enumerate(available)
+    )
+
+
+class _CountingReader:
+    """File-like proxy that counts bytes read from the underlying socket file."""
+
+    def __init__(self, fp):
+        self._fp = fp
+        self.bytes_read = 0
+
+    def read(self, *args):
+        data = self._fp.read(*args)
+        self.bytes_read += len(data)
+        return data
+
+    def read1(self, *args):
+        data = self._fp.read1(*args)
+        self.bytes_read += len(data)
+        return data
+
+    def readline(self, *args):
+        data = self._fp.readline(*args)
+        self.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer):
+        count = self._fp.readinto(buffer)
+        self.bytes_read += count or 0
+        return count
+
+    def __getattr__(self, name):
+        return getattr(self._fp, name)
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that attaches a wire byte counter to each response."""
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        # resp._fp is the http.client response; its .fp is the socket file
+        # that both plain and chunked body reads go through
+        http_response = getattr(resp, "_fp", None)
+        if getattr(http_response, "fp", None) is not None:
+            counter = _CountingReader(http_response.fp)
+            http_response.fp = counter
+            response.wire_counter = counter
+        return response
+
+
+class TransportSession(requests.Session):
+    """requests.Session that records wire vs decoded bytes per host."""
+
+    def __init__(self):
+        super().__init__()
+        self._stats: Dict[str, Dict[str, Optional[int]]] = {}
+        self._stats_lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        if not kwargs.get("stream", False):
+            # Redirect hops are recorded by the nested send() calls made in
+            # resolve_redirects, so only count the response this call fetched
+            self._record(response.history[0] if response.history else response)
+        return response
+
+    def _record(self, response: requests.Response) -> None:
+        host = urlsplit(response.url).hostname or "unknown"
+        decompressed = len(response.content or b"")
+        counter = getattr(response, "wire_counter", None)
+        compressed = counter.bytes_read if counter is not None else None
+        with self._stats_lock:
+            entry = self._stats.setdefault(
+                host, {"requests": 0, "compressed_bytes": 0, "decompressed_bytes": 0}
+            )
+            entry["requests"] += 1
+            entry["decompressed_bytes"] += decompressed
+            # One unmeasured response makes the host total unknown
+            if compressed is None or entry["compressed_bytes"] is None:
+                entry["compressed_bytes"] = None
+            else:
+                entry["compressed_bytes"] += compressed
+
+    def bandwidth_stats(self) -> Dict[str, Dict[str, Optional[int]]]:
+        """Return a snapshot of per-host request and byte counters."""
+        with self._stats_lock:
+            return {host: dict(entry) for host, entry in self._stats.items()}
+
+
+def _build_session() -> TransportSession:
+    """Create a TransportSession with pooled adapters and default headers."""
+    session = TransportSession()
+    adapter = CountingHTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    session.headers["Accept-Encoding"] = build_accept_encoding()
+    return session
+
+
+def get_session() -> TransportSession:
+    """
+    Return the process-wide session shared by all scrapers
+
+    The session is created on first use with pooled keep-alive adapters
+    and the common browser headers.
+
+    Returns:
+        Shared TransportSession instance
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def log_bandwidth_summary(log) -> None:
+    """
+    Log compressed vs decompressed byte totals for each host contacted
+
+    Args:
+        log: Logger instance to write the summary to
+    """
+    if _session is None:
+        return
+    for host, entry in sorted(_session.bandwidth_stats().items()):
+        compressed = entry["compressed_bytes"]
+        decompressed = entry["decompressed_bytes"]
+        if compressed is None:
+            wire = "unknown bytes on wire"
+        else:
+            ratio = compressed / decompressed if decompressed else 1.0
+            wire = f"{compressed} bytes on wire ({ratio:.1%} of decoded size)"
+        log.info(
+            f"Bandwidth {host}: {entry['requests']} requests, "
+            f"{wire}, {decompressed} bytes decoded"
+        )